@@ -1,3 +1,5 @@
+import os
+
 from skyfield import api
 from skyfield import almanac
 
@@ -6,8 +8,21 @@ EVENT_SUMMER_SOLSTICE = 1
 EVENT_AUTUMNAL_EQUINOX = 2
 EVENT_WINTER_SOLSTICE = 3
 
+EPHEMERIS_ENV = 'EMM_EPHEMERIS'  # optional path to an ephemeris excerpt written by ephemeris_excerpt.py
+
+
+def load_ephemeris(path=None):
+    """
+    Loads the SPK kernel at the input path, or the full JPL ephemeris DE421 (covers 1900-2050) if no path is given.
+    Kernel segments are memory-mapped, so only the pages touched by computations become resident.
+    """
+    if path:
+        return api.load_file(path)
+    return api.load('de421.bsp')
+
+
 timescale = api.load.timescale()
-ephemeris = api.load('de421.bsp')  # load the JPL ephemeris DE421 (covers 1900-2050)
+ephemeris = load_ephemeris(os.environ.get(EPHEMERIS_ENV))
 greenwich = api.Topos('51.48 N', '0 W')
 
 
@@ -155,7 +170,13 @@ def orbit_degrees_from_winter_solstice(time):
     """
     # determine a pair of straddling season events
     evts = surrounding_events(time, 100, season_event_times)
+    return orbit_degrees_between(evts, time)
+
 
+def orbit_degrees_between(evts, time):
+    """
+    Computes earth orbit degrees of the input time given the pair of straddling season events.
+    """
     # convert fractional value to seasonal degrees offset [0, 90]
     degrees = position_as_percent(evts, time) * 90
 
@@ -170,7 +191,13 @@ def rotation_degrees_from_solar_noon(time):
     """
     # determine pair of solar noon/nadir events
     evts = surrounding_events(time, 1, noon_nadir_event_times)
+    return rotation_degrees_between(evts, time)
+
 
+def rotation_degrees_between(evts, time):
+    """
+    Computes earth rotation degrees of the input time given the pair of straddling solar noon/nadir events.
+    """
     # convert fractional value to degrees offset [0, 180]
     degrees = position_as_percent(evts, time) * 180
 
@@ -178,13 +205,49 @@ def rotation_degrees_from_solar_noon(time):
     return degrees if evts[0].event.value else degrees + 180
 
 
-def earth(time):
+def rotation_degrees_from_hour_angle(time):
+    """
+    Computes earth rotation degrees of the input time from the hour angle of the sun at Greenwich.
+    Scale goes from 0-360 starting at solar noon, matching rotation_degrees_from_solar_noon to within a fraction of a degree.
+    Accepts a Skyfield Time array, in which case an array of degrees is returned.
+    """
+    observer = ephemeris['earth'] + greenwich
+    ha, _, _ = observer.at(time).observe(ephemeris['sun']).apparent().hadec()
+    return ha.hours * 15 % 360
+
+
+def earth(time, rotation_degrees=rotation_degrees_from_solar_noon):
     eo_degrees = orbit_degrees_from_winter_solstice(time)
-    er_degrees = rotation_degrees_from_solar_noon(time)
+    er_degrees = rotation_degrees(time)
     mo_degrees = almanac.moon_phase(ephemeris, time).degrees
     return Earth(eo_degrees, er_degrees, mo_degrees)
 
 
+def earth_track(times, hour_angle=False):
+    """
+    Computes earth positions for an ascending Skyfield Time array.
+    Season and solar noon/nadir events are found once for the whole span rather than once per time,
+    and moon phase is computed for all times in a single vectorized call.
+    With hour_angle, earth rotation is also computed in a single vectorized call from the sun's hour angle.
+    Returns list of Earth objects.
+    """
+    first, last = times[0], times[-1]
+    seasons = season_event_times(timescale.tt_jd(first.tt - 100), timescale.tt_jd(last.tt + 100))
+    if hour_angle:
+        er_degrees = rotation_degrees_from_hour_angle(times)
+    else:
+        noons = noon_nadir_event_times(timescale.tt_jd(first.tt - 1), timescale.tt_jd(last.tt + 1))
+        er_degrees = [rotation_degrees_between(find_surrounding_events(noons, times[i]), times[i])
+                      for i in range(len(times.tt))]
+    mo_degrees = almanac.moon_phase(ephemeris, times).degrees
+    result = []
+    for i in range(len(times.tt)):
+        time = times[i]
+        eo_degrees = orbit_degrees_between(find_surrounding_events(seasons, time), time)
+        result.append(Earth(eo_degrees, er_degrees[i], mo_degrees[i]))
+    return result
+
+
 def earth_now():
     return earth(timescale.now())
 
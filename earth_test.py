@@ -31,6 +31,43 @@ class TestEarth(unittest.TestCase):
         # 551 / 721 = 0.764 = 137.559 degrees of rotation from nadir and 317.559 degrees from solar noon
         self.assertAlmostEqual(317.559, e.er_degrees, delta=1.0)
 
+    def test_earth_track(self):
+        t0 = timescale.from_datetime(datetime.fromisoformat('2022-12-20T00:00:00+00:00'))
+        times = timescale.tt_jd([t0.tt + i / 4 for i in range(12)])  # spans winter solstice
+        track = earth.earth_track(times)
+        self.assertEqual(12, len(track))
+        for i, e in enumerate(track):
+            expected = earth.earth(times[i])
+            self.assertAlmostEqual(expected.eo_degrees, e.eo_degrees, places=4)
+            self.assertAlmostEqual(expected.er_degrees, e.er_degrees, places=4)
+            self.assertAlmostEqual(expected.mo_degrees, e.mo_degrees, places=4)
+
+    def test_hour_angle_rotation(self):
+        # compare with sunrise/sunset midpoints every 135 hours through a year, sampling all times of day
+        t0 = timescale.from_datetime(datetime.fromisoformat('2022-01-01T00:00:00+00:00'))
+        times = timescale.tt_jd([t0.tt + i * 0.375 for i in range(0, 976, 15)])
+        hour_angle = earth.rotation_degrees_from_hour_angle(times)
+        for i, degrees in enumerate(hour_angle):
+            self.assertTrue(0 <= degrees < 360)
+            midpoint = earth.rotation_degrees_from_solar_noon(times[i])
+            diff = (degrees - midpoint + 180) % 360 - 180
+            self.assertAlmostEqual(0, diff, delta=0.25)
+
+    def test_hour_angle_summer_solstice(self):
+        dt = datetime.fromisoformat('2022-06-21T09:13:00+00:00')
+        ts = timescale.from_datetime(dt)
+        e = earth.earth(ts, earth.rotation_degrees_from_hour_angle)
+        self.assertEqual(180, round(e.eo_degrees))
+        self.assertAlmostEqual(317.559, e.er_degrees, delta=1.0)
+
+    def test_earth_track_hour_angle(self):
+        t0 = timescale.from_datetime(datetime.fromisoformat('2022-12-20T00:00:00+00:00'))
+        times = timescale.tt_jd([t0.tt + i / 4 for i in range(12)])
+        track = earth.earth_track(times, hour_angle=True)
+        for i, e in enumerate(track):
+            expected = earth.earth(times[i], earth.rotation_degrees_from_hour_angle)
+            self.assertAlmostEqual(expected.er_degrees, e.er_degrees, places=4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from jplephem.daf import DAF
+from jplephem.excerpter import write_excerpt
+from jplephem.spk import SPK
+from skyfield import api
+
+# segments reached by earth.earth():
+# earth barycenter (3), sun (10), moon (301), and earth (399) for positions,
+# jupiter barycenter (5) and saturn barycenter (6) for light deflection in apparent positions
+TARGETS = (3, 5, 6, 10, 301, 399)
+
+# earth.earth() searches for season events up to 100 days either side of the input time
+MARGIN_DAYS = 101
+
+timescale = api.load.timescale()
+
+
+def excerpt(input_path, output_path, start, end, targets=TARGETS):
+    """
+    Writes an SPK kernel holding only the input target segments between start and end Skyfield times,
+    widened by the margin that earth.earth() searches around each time.
+    Returns list of segment descriptions of the written kernel.
+    """
+    with open(input_path, 'rb') as f:
+        spk = SPK(DAF(f))
+        summaries = [summary for summary, segment in zip(spk.daf.summaries(), spk.segments)
+                     if segment.target in targets]
+        with open(output_path, 'w+b') as output_file:
+            write_excerpt(spk, output_file, start.tt - MARGIN_DAYS, end.tt + MARGIN_DAYS, summaries)
+
+    with open(output_path, 'rb') as f:
+        return [str(segment) for segment in SPK(DAF(f)).segments]
+
+
+def midpoint(path):
+    """
+    Computes the TT julian date halfway through the dates covered by every segment of the input kernel.
+    """
+    with open(path, 'rb') as f:
+        segments = SPK(DAF(f)).segments
+        start = max(segment.start_jd for segment in segments)
+        end = min(segment.end_jd for segment in segments)
+    return (start + end) / 2
+
+
+def probe(tt):
+    """
+    Imports earth module, computes the position at the input TT julian date, and reports timings and memory usage.
+    Intended to run in a fresh process so that measurements for different kernels do not interfere.
+    """
+    rss_start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    import earth
+    t1 = time.perf_counter()
+    earth.earth(earth.timescale.tt_jd(tt))
+    t2 = time.perf_counter()
+    return {
+        'load_seconds': t1 - t0,
+        'earth_seconds': t2 - t1,
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'max_rss_delta_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_start,
+    }
+
+
+def measure(tt, path=None):
+    """
+    Measures the input kernel, or the full kernel if no path is given, in a separate process.
+    The position is computed at the input TT julian date, which must lie within the kernel.
+    Returns dictionary of file size, timings, and memory usage.
+    """
+    import earth
+
+    env = dict(os.environ)
+    env.pop(earth.EPHEMERIS_ENV, None)
+    if path:
+        env[earth.EPHEMERIS_ENV] = path
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), 'probe', repr(tt)],
+                         env=env, check=True, capture_output=True, text=True).stdout
+    result = json.loads(out)
+    result['path'] = path or 'de421.bsp'
+    result['file_bytes'] = os.path.getsize(result['path'])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write and measure a trimmed ephemeris for earth.py.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    p = commands.add_parser('excerpt', help='write a kernel with only the bodies and dates that earth.py uses')
+    p.add_argument('start', help='ISO-formatted first date to be modeled')
+    p.add_argument('end', help='ISO-formatted last date to be modeled')
+    p.add_argument('output', help='output kernel path')
+    p.add_argument('--input', default='de421.bsp', help='full kernel path')
+    p = commands.add_parser('measure', help='compare load time and memory of the full kernel and an excerpt')
+    p.add_argument('path', help='excerpt kernel path')
+    p = commands.add_parser('probe', help=argparse.SUPPRESS)
+    p.add_argument('tt', type=float)
+    args = parser.parse_args()
+
+    if args.command == 'excerpt':
+        start = timescale.from_datetime(datetime.fromisoformat(args.start))
+        end = timescale.from_datetime(datetime.fromisoformat(args.end))
+        for segment in excerpt(args.input, args.output, start, end):
+            print(segment)
+    elif args.command == 'measure':
+        tt = midpoint(args.path)  # within both kernels
+        for result in measure(tt), measure(tt, args.path):
+            print(result)
+    else:
+        print(json.dumps(probe(args.tt)))
+
+
+if __name__ == '__main__':
+    main()
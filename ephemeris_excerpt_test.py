@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+
+from skyfield import almanac
+
+import earth
+import ephemeris_excerpt
+
+
+class TestEphemerisExcerpt(unittest.TestCase):
+
+    def test_excerpt(self):
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 7, 1)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'excerpt.bsp')
+            segments = ephemeris_excerpt.excerpt('de421.bsp', path, start, end)
+            self.assertEqual(len(ephemeris_excerpt.TARGETS), len(segments))
+            self.assertLess(os.path.getsize(path), os.path.getsize('de421.bsp') / 10)
+
+            kernel = earth.load_ephemeris(path)
+            t = earth.timescale.utc(2022, 6, 21, 9, 13)
+            self.assertAlmostEqual(almanac.moon_phase(earth.ephemeris, t).degrees,
+                                   almanac.moon_phase(kernel, t).degrees, places=6)
+            f = almanac.sunrise_sunset(kernel, earth.greenwich)
+            t0 = earth.timescale.utc(2022, 6, 21)
+            t1 = earth.timescale.utc(2022, 6, 22)
+            self.assertEqual(2, len(almanac.find_discrete(t0, t1, f)[0]))
+
+    def test_measure(self):
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 7, 1)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'excerpt.bsp')
+            ephemeris_excerpt.excerpt('de421.bsp', path, start, end)
+            tt = ephemeris_excerpt.midpoint(path)
+            self.assertTrue(start.tt < tt < end.tt)
+            result = ephemeris_excerpt.measure(tt, path)  # excerpt does not cover today
+            self.assertEqual(path, result['path'])
+            self.assertEqual(os.path.getsize(path), result['file_bytes'])
+            self.assertGreater(result['max_rss_kb'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import argparse
+import atexit
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import earth
+import model
+import motor
+import pose_table
+import scheduler
+
+logger = logging.getLogger(__name__)
+
+STATUS_HOMING = 'homing'
+STATUS_READY = 'ready'
+STATUS_FAILED = 'failed'
+
+# unit configuration defaults match the single-unit settings in main.py, motor current ratings and scheduler are shared
+DEFAULT_CONFIG = {
+    'addresses': [0x60, 0x61],  # MotorKit I2C addresses of lower and upper Motor HAT
+    'pins': [17, 27, 23],  # sensor GPIO pins of earth orbit, earth rotation, moon orbit
+    'steps_per_rev': 200,
+    'sleeps': [0.1, 0.05, 0.05],  # sleep between steps of earth orbit, earth rotation, moon orbit
+}
+
+
+class UnitLogger:
+    """
+    Logger that prefixes each message with a unit name.
+    """
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def info(self, message):
+        self.log.info(f'unit={self.name}, {message}')
+
+
+class Unit:
+    """
+    Class composed of a unit name and its Model, along with homing and health status.
+    A unit that fails to home or to move is marked failed and is skipped on later ticks.
+    """
+
+    def __init__(self, name, em):
+        self.name = name
+        self.model = em
+        self.status = STATUS_HOMING
+        self.error = None
+        self.moves = 0
+        self.move_seconds = 0
+
+    def init(self):
+        self.status = STATUS_HOMING
+        try:
+            self.model.init()
+            self.status = STATUS_READY
+        except Exception as e:
+            self.status = STATUS_FAILED
+            self.error = str(e)
+
+    def next(self, earth):
+        if self.status != STATUS_READY:
+            return
+        start = time.monotonic()
+        try:
+            self.model.next(earth)
+            self.moves += 1
+        except Exception as e:
+            self.status = STATUS_FAILED
+            self.error = str(e)
+        self.move_seconds = time.monotonic() - start
+
+    def health(self):
+        return {
+            'unit': self.name,
+            'status': self.status,
+            'error': self.error,
+            'moves': self.moves,
+            'move_seconds': round(self.move_seconds, 3),
+        }
+
+
+class Fleet:
+    """
+    Drives several units from one shared pose per tick.
+    Homing and motion run in parallel, one thread per unit.
+    """
+
+    def __init__(self, units, log):
+        self.units = units
+        self.log = log
+        self.executor = ThreadPoolExecutor(max_workers=len(units), thread_name_prefix='unit')
+
+    def _each(self, func):
+        list(self.executor.map(func, self.units))
+
+    def _log_health(self):
+        for unit in self.units:
+            self.log.info(f'health, {unit.health()}')
+
+    def init(self):
+        self._each(Unit.init)
+        self._log_health()
+
+    def next(self, earth):
+        self._each(lambda unit: unit.next(earth))
+        self._log_health()
+
+    def health(self):
+        return [unit.health() for unit in self.units]
+
+
+def validate_configs(configs):
+    """
+    Checks that there is at least one unit, that every unit has a unique name and well-formed settings,
+    and that units do not share hardware.
+    Every unit after the first must set addresses and pins, and no two units may share an I2C address or GPIO pin.
+    Raises ValueError on the first problem found.
+    """
+    if not configs:
+        raise ValueError('no units configured')
+    names = set()
+    addresses = {}
+    pins = {}
+    for i, config in enumerate(configs):
+        name = config.get('name')
+        if not name:
+            raise ValueError(f'unit must set name, index={i}')
+        if name in names:
+            raise ValueError(f'unit name shared, unit={name}')
+        names.add(name)
+        if i > 0:
+            for key in 'addresses', 'pins':
+                if key not in config:
+                    raise ValueError(f'unit must set {key}, unit={name}')
+        config = dict(DEFAULT_CONFIG, **config)
+        for key, count in ('addresses', 2), ('pins', 3), ('sleeps', 3):
+            if len(config[key]) != count:
+                raise ValueError(f'unit must set {count} {key}, unit={name}, {key}={config[key]}')
+        for address in config['addresses']:
+            if address in addresses:
+                raise ValueError(f'I2C address shared, address={address}, units={addresses[address]}/{name}')
+            addresses[address] = name
+        for pin in config['pins']:
+            if pin in pins:
+                raise ValueError(f'GPIO pin shared, pin={pin}, units={pins[pin]}/{name}')
+            pins[pin] = name
+
+
+def build_unit(name, config):
+    """
+    Builds a Unit with hardware motors and sensors from a unit configuration dictionary.
+    Returns tuple of (1) Unit and (2) list of steppers to release on exit.
+    """
+    from adafruit_motorkit import MotorKit
+
+    import sensor
+
+    config = dict(DEFAULT_CONFIG, **config)
+    kit = MotorKit(address=config['addresses'][0])
+    kit2 = MotorKit(address=config['addresses'][1])
+    eo_pin, er_pin, mo_pin = config['pins']
+    eo_sleep, er_sleep, mo_sleep = config['sleeps']
+    spr = config['steps_per_rev']
+
+    ma = scheduler.MOTOR_MA
+    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(eo_pin), eo_sleep, spr, stepping_ma=ma, holding_ma=ma)
+    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(er_pin), er_sleep, stepping_ma=ma, holding_ma=ma)
+    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(mo_pin), mo_sleep, stepping_ma=ma, holding_ma=ma)
+
+    em = model.Model(eo_motor, er_motor, mo_motor, UnitLogger(name, logger), spr, scheduler.Scheduler())
+    return Unit(name, em), [kit.stepper1, kit.stepper2, kit2.stepper1]
+
+
+def main():
+    import main as app
+
+    parser = argparse.ArgumentParser(description='Drive several earth moon models from one process.')
+    parser.add_argument('config', help='JSON file with a list of units, each with a name, addresses (decimal) and pins '
+                                       '(optional for the first unit only), and optional steps_per_rev and sleeps')
+    args = parser.parse_args()
+
+    app.init_logger('earth_model_fleet.log')
+
+    with open(args.config) as f:
+        configs = json.load(f)
+    validate_configs(configs)
+
+    units = []
+    steppers = []
+    for config in configs:
+        unit, unit_steppers = build_unit(config['name'], config)
+        units.append(unit)
+        steppers.extend(unit_steppers)
+
+    atexit.register(app.turn_off_motors, steppers)
+
+    fleet = Fleet(units, logger)
+    fleet.init()
+
+    table_path = os.environ.get(app.POSE_TABLE_ENV)
+    table = pose_table.PoseTable(table_path) if table_path else None
+    while True:
+        fleet.next(pose_table.earth_at(table, earth.timescale.now()))
+        time.sleep(60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+from collections import namedtuple
+
+import fleet
+import model
+import motor
+import stub
+
+Earth = namedtuple('Earth', ['eo_degrees', 'er_degrees', 'mo_degrees'])
+
+
+class TestLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+class SlowStepper(stub.MotorAssembly):
+    """
+    Stub motor assembly that records the threads stepping it concurrently.
+    """
+    active = set()
+    overlap = False
+    lock = threading.Lock()
+
+    def onestep(self, direction):
+        with SlowStepper.lock:
+            SlowStepper.active.add(threading.current_thread().name)
+            if len(SlowStepper.active) > 1:
+                SlowStepper.overlap = True
+        time.sleep(0.001)
+        super().onestep(direction)
+        with SlowStepper.lock:
+            SlowStepper.active.discard(threading.current_thread().name)
+
+
+def new_unit(name, sensor_range, assembly=stub.MotorAssembly):
+    eo_tm = assembly(100, sensor_range)
+    er_tm = assembly(200, sensor_range)
+    mo_tm = assembly(300, sensor_range)
+    eo_motor = motor.Motor(eo_tm, eo_tm)
+    er_motor = motor.Motor(er_tm, er_tm)
+    mo_motor = motor.Motor(mo_tm, mo_tm)
+    return fleet.Unit(name, model.Model(eo_motor, er_motor, mo_motor, TestLogger(), 360))
+
+
+class TestFleet(unittest.TestCase):
+    def test_fleet(self):
+        sensor_range = [(350, 360), (0, 10)]
+        a = new_unit('a', sensor_range)
+        b = new_unit('b', [])  # no sensor signal, homing fails
+        c = new_unit('c', sensor_range)
+        logger = TestLogger()
+        f = fleet.Fleet([a, b, c], logger)
+        f.init()
+        self.assertEqual([fleet.STATUS_READY, fleet.STATUS_FAILED, fleet.STATUS_READY],
+                         [h['status'] for h in f.health()])
+        self.assertEqual('unable to locate earth-orbit reference position', b.error)
+
+        f.next(Earth(90, 30, 60))
+        for unit in a, c:
+            self.assertEqual(-100 - 90, unit.model.eo_motor.steps)
+            self.assertEqual(160 + 90 + 30, unit.model.er_motor.steps)
+            self.assertEqual(60 - 90 - 60, unit.model.mo_motor.steps)
+        self.assertEqual([1, 0, 1], [h['moves'] for h in f.health()])
+        self.assertEqual(6, len(logger.messages))  # one health line per unit per init and tick
+
+    def test_parallel_motion(self):
+        sensor_range = [(350, 360), (0, 10)]
+        units = [new_unit(name, sensor_range, SlowStepper) for name in 'ab']
+        f = fleet.Fleet(units, TestLogger())
+        f.init()
+        self.assertTrue(SlowStepper.overlap)
+
+    def test_validate_configs(self):
+        fleet.validate_configs([{'name': 'a'}, {'name': 'b', 'addresses': [98, 99], 'pins': [5, 6, 13]}])
+        with self.assertRaisesRegex(ValueError, 'unit must set addresses, unit=b'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'b'}])
+        with self.assertRaisesRegex(ValueError, 'unit must set pins, unit=b'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'b', 'addresses': [98, 99]}])
+        with self.assertRaisesRegex(ValueError, 'I2C address shared, address=97, units=a/b'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'b', 'addresses': [97, 98], 'pins': [5, 6, 13]}])
+        with self.assertRaisesRegex(ValueError, 'GPIO pin shared, pin=17, units=a/b'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'b', 'addresses': [98, 99], 'pins': [5, 6, 17]}])
+        with self.assertRaisesRegex(ValueError, 'no units configured'):
+            fleet.validate_configs([])
+        with self.assertRaisesRegex(ValueError, 'unit must set name, index=1'):
+            fleet.validate_configs([{'name': 'a'}, {'addresses': [98, 99], 'pins': [5, 6, 13]}])
+        with self.assertRaisesRegex(ValueError, 'unit name shared, unit=a'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'a', 'addresses': [98, 99], 'pins': [5, 6, 13]}])
+        with self.assertRaisesRegex(ValueError, 'unit must set 2 addresses, unit=a'):
+            fleet.validate_configs([{'name': 'a', 'addresses': [96]}])
+        with self.assertRaisesRegex(ValueError, 'unit must set 3 pins, unit=b'):
+            fleet.validate_configs([{'name': 'a'}, {'name': 'b', 'addresses': [98, 99], 'pins': [5, 6]}])
+        with self.assertRaisesRegex(ValueError, 'unit must set 3 sleeps, unit=a'):
+            fleet.validate_configs([{'name': 'a', 'sleeps': [0.1, 0.05]}])
+
+    def test_unit_logger(self):
+        logger = TestLogger()
+        fleet.UnitLogger('a', logger).info('message')
+        self.assertEqual(['unit=a, message'], logger.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
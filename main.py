@@ -1,6 +1,7 @@
 import atexit
 import logging
 import logging.handlers
+import os
 import time
 
 from adafruit_motorkit import MotorKit
@@ -8,6 +9,8 @@ from adafruit_motorkit import MotorKit
 import earth
 import model
 import motor
+import pose_table
+import scheduler
 import sensor
 
 logger = logging.getLogger(__name__)
@@ -18,6 +21,8 @@ EO_SLEEP = 0.1
 ER_SLEEP = 0.05
 MO_SLEEP = 0.05
 
+POSE_TABLE_ENV = 'EMM_POSE_TABLE'  # optional path to a table written by pose_table.py
+
 
 def turn_off_motors(steppers):
     for stepper in steppers:
@@ -41,16 +46,20 @@ def main():
     kit = MotorKit()
     kit2 = MotorKit(address=0x61)
 
-    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(17), EO_SLEEP, STEPS_PER_REV)
-    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(27), ER_SLEEP)
-    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(23), MO_SLEEP)
+    ma = scheduler.MOTOR_MA
+    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(17), EO_SLEEP, STEPS_PER_REV, stepping_ma=ma, holding_ma=ma)
+    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(27), ER_SLEEP, stepping_ma=ma, holding_ma=ma)
+    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(23), MO_SLEEP, stepping_ma=ma, holding_ma=ma)
 
     atexit.register(turn_off_motors, [kit.stepper1, kit.stepper2, kit2.stepper1])
 
-    eo_model = model.Model(eo_motor, er_motor, mo_motor, logger, STEPS_PER_REV)
+    eo_model = model.Model(eo_motor, er_motor, mo_motor, logger, STEPS_PER_REV, scheduler.Scheduler())
     eo_model.init()
+
+    table_path = os.environ.get(POSE_TABLE_ENV)
+    table = pose_table.PoseTable(table_path) if table_path else None
     while True:
-        eo_model.next(earth.earth(earth.timescale.now()))
+        eo_model.next(pose_table.earth_at(table, earth.timescale.now()))
         time.sleep(60)
 
 
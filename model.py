@@ -1,12 +1,14 @@
+import scheduler
 import steps
 
 
 class Model:
-    def __init__(self, eo_motor, er_motor, mo_motor, logger, steps_per_rev):
+    def __init__(self, eo_motor, er_motor, mo_motor, logger, steps_per_rev, motion_scheduler=None):
         self.eo_motor = eo_motor
         self.er_motor = er_motor
         self.mo_motor = mo_motor
         self.logger = logger
+        self.scheduler = motion_scheduler  # moves axes one after another when None
         self.units = steps.Units(steps_per_rev)
         self.steps = [steps.Steps(self.units, wrap=False), steps.Steps(self.units), steps.Steps(self.units)]
 
@@ -53,6 +55,10 @@ class Model:
         if not success:
             raise ValueError('unable to locate moon-orbit reference position')
 
+        # earth rotation and moon orbit pass over their sensors daily and monthly, so verify them along the way
+        self.er_motor.enable_verification(spr)
+        self.mo_motor.enable_verification(spr)
+
     def _rescale_earth_orbit(self, degrees):
         """
         Rescale earth orbit degrees 0 to 360 maps to 0 to -180 and 180 back to 0.
@@ -67,19 +73,49 @@ class Model:
                          f'earth_rotation[degrees={earth.er_degrees:.4f}, steps={er_steps.steps}], '
                          f'moon_orbit[degrees={earth.mo_degrees:.4f}, steps={mo_steps.steps}]')
 
-    def next(self, earth):
+    def targets(self, earth):
+        """
+        Converts earth and moon positions to absolute target steps for each motor.
+        Returns list of Steps objects in earth orbit, earth rotation, moon orbit order.
+        """
         eo_steps = steps.Steps(self.units, degrees=self._rescale_earth_orbit(earth.eo_degrees), wrap=False)
         er_steps = steps.Steps(self.units, degrees=earth.er_degrees)
         mo_steps = steps.Steps(self.units, degrees=earth.mo_degrees).reverse()  # reverse since moon is inverted
-        self._log_position(earth, eo_steps, er_steps, mo_steps)
+        return [eo_steps, er_steps, mo_steps]
 
-        eo_steps_last, er_steps_last, mo_steps_last = self.steps
+    def diffs(self, last, targets):
+        """
+        Computes the steps each motor must take to move from the last targets to the next targets.
+        Earth rotation and moon orbit motors are mounted on the earth orbit motor, so they compensate for its movement.
+        Returns list of Steps objects in earth orbit, earth rotation, moon orbit order.
+        """
+        eo_steps, er_steps, mo_steps = targets
+        eo_steps_last, er_steps_last, mo_steps_last = last
 
         eo_steps_diff = eo_steps - eo_steps_last
         er_steps_diff = (er_steps - er_steps_last) + eo_steps_diff.reverse()
         mo_steps_diff = (mo_steps - mo_steps_last) + eo_steps_diff
+        return [eo_steps_diff, er_steps_diff, mo_steps_diff]
+
+    def next(self, earth):
+        targets = self.targets(earth)
+        self._log_position(earth, *targets)
+
+        eo_steps_diff, er_steps_diff, mo_steps_diff = self.diffs(self.steps, targets)
+        moves = [
+            scheduler.Move('earth_orbit', self.eo_motor, *eo_steps_diff.get()),
+            scheduler.Move('earth_rotation', self.er_motor, *er_steps_diff.get()),
+            scheduler.Move('moon_orbit', self.mo_motor, *mo_steps_diff.get())]
+
+        if self.scheduler:
+            plan = self.scheduler.plan(moves, [self.eo_motor, self.er_motor, self.mo_motor])
+            self.logger.info(f'motion plan, {plan}')
+            self.scheduler.run(plan)
+        else:
+            for move in moves:
+                move.run()
+        self.steps = targets
 
-        self.eo_motor.take_steps(*eo_steps_diff.get())
-        self.er_motor.take_steps(*er_steps_diff.get())
-        self.mo_motor.take_steps(*mo_steps_diff.get())
-        self.steps = [eo_steps, er_steps, mo_steps]
+        for move in moves:
+            for offset in move.motor.pop_offsets():
+                self.logger.info(f'corrected position, motor={move.name}, offset={offset}')
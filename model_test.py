@@ -64,3 +64,20 @@ class TestModel(unittest.TestCase):
         self.assertEqual(5 - 25 + 30, mo_motor.steps)  # shortest path for +330 is -30
         em.next(Earth(25, 0, 5))
         self.assertEqual(5 - 25 + 30 - 35, mo_motor.steps)
+
+    def test_lost_steps_corrected(self):
+        sensor_range = [(350, 360), (0, 10)]
+        eo_tm = stub.MotorAssembly(100, sensor_range)
+        er_tm = stub.MotorAssembly(200, sensor_range)
+        mo_tm = stub.MotorAssembly(300, sensor_range)
+        eo_motor = motor.Motor(eo_tm, eo_tm)
+        er_motor = motor.Motor(er_tm, er_tm)
+        mo_motor = motor.Motor(mo_tm, mo_tm)
+        logger = TestLogger()
+        em = model.Model(eo_motor, er_motor, mo_motor, logger, 360)
+        em.init()
+        em.next(Earth(0, 300, 0))
+        er_tm.degrees -= 4  # lose 4 steps
+        em.next(Earth(0, 30, 0))  # pass over sensor
+        self.assertIn('corrected position, motor=earth_rotation, offset=4', logger.messages)
+        self.assertEqual(30, er_tm.degrees)
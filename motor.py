@@ -12,14 +12,26 @@ class Motor:
     Motor offer two primitives:
     (1) scan to seek the reference position in one direction
     (2) take_steps to move forward or backward a number of steps
+    Once verification is enabled, take_steps also watches for the edge of the sensing region found by
+    the last scan and corrects small offsets caused by lost steps.
     """
 
-    def __init__(self, stepper, sensor, sleep=0, max_steps=None):
+    def __init__(self, stepper, sensor, sleep=0, max_steps=None, stepping_ma=0, holding_ma=0):
         self.stepper = stepper
         self.sensor = sensor
         self.sleep = sleep
         self.max_steps = max_steps
+        self.stepping_ma = stepping_ma  # estimated supply current while stepping
+        self.holding_ma = holding_ma  # estimated supply current while coils hold position
+        self.energized = False
         self.steps = 0
+        self.region = None  # first and last sensing steps found by the last successful scan
+        self.entries = {}  # steps where the sensing region was entered by the last scan, keyed by forward
+        self.steps_per_rev = None  # set when verification is enabled
+        self.tolerance = 0
+        self.offsets = []  # offsets corrected since last pop_offsets
+        self._last_sensing = None
+        self._last_forward = None
 
     def _sleep(self):
         time.sleep(self.sleep)
@@ -35,6 +47,7 @@ class Motor:
     def _onestep(self, forward):
         self._check_max_steps()
         self.stepper.onestep(direction=FORWARD if forward else BACKWARD)
+        self.energized = True
         self.steps += 1 if forward else -1
         self._sleep()
 
@@ -44,6 +57,70 @@ class Motor:
         """
         for i in range(steps):
             self._onestep(forward)
+            if self.steps_per_rev:
+                self._verify(forward)
+
+    def release(self):
+        """
+        De-energize the coils so the motor draws no holding current.
+        """
+        self.stepper.release()
+        self.energized = False
+
+    def enable_verification(self, steps_per_rev, tolerance=1):
+        """
+        Verify position against the sensing region of the last successful scan during take_steps.
+        Offsets of up to tolerance steps are ignored to allow for sensor hysteresis.
+        """
+        self.steps_per_rev = steps_per_rev
+        self.tolerance = tolerance
+        self._last_sensing = None
+
+    def pop_offsets(self):
+        """
+        Returns list of offsets corrected since the last call.
+        Positive offsets are steps lost in the direction of travel.
+        """
+        offsets, self.offsets = self.offsets, []
+        return offsets
+
+    def _signed(self, steps):
+        """
+        Normalize steps to the range (-half rev, half rev].
+        """
+        steps %= self.steps_per_rev
+        return steps - self.steps_per_rev if steps > self.steps_per_rev / 2 else steps
+
+    def _near_region(self):
+        """
+        Determines if current position lies within one region width of the sensing region.
+        """
+        lo, hi = self.region
+        width = hi - lo + 1
+        return -width <= self._signed(self.steps - lo) < 2 * width
+
+    def _verify(self, forward):
+        """
+        Reads the sensor near the sensing region and checks the position where the region is entered.
+        Each direction is checked against the entry step the last scan found moving that way,
+        since a sensor with hysteresis turns on at different steps from either side.
+        On a mismatch, the motor takes uncounted steps so that its physical position matches self.steps again.
+        """
+        if forward not in self.entries or not self._near_region() or forward != self._last_forward:
+            self._last_sensing = None
+            self._last_forward = forward
+            return
+
+        sensing = self.sensor.sensing()
+        if self._last_sensing is False and sensing:
+            entry = self.entries[forward]
+            offset = self._signed(self.steps - entry if forward else entry - self.steps)
+            if abs(offset) > self.tolerance:
+                for i in range(abs(offset)):
+                    self.stepper.onestep(direction=FORWARD if forward == (offset > 0) else BACKWARD)
+                    self._sleep()
+                self.offsets.append(offset)
+        self._last_sensing = sensing
 
     def _step_until_sensor_signal(self, forward, max_steps, target_signal):
         """
@@ -76,6 +153,8 @@ class Motor:
             4. Step half way back in negative direction
         Return tuple with (1) bool indicating success status and (2) list of steps taken in target direction
         """
+        self.region = None
+        self.entries = {}
         all_steps = []
         found, steps = self._step_while_over_sensor(not forward, max_sensor_steps)
         all_steps.append(-steps)
@@ -86,6 +165,7 @@ class Motor:
         all_steps.append(steps)
         if not found:
             return False, all_steps
+        entry = self.steps
 
         found, steps = self._step_while_over_sensor(forward, max_sensor_steps)
         all_steps.append(steps)
@@ -99,7 +179,19 @@ class Motor:
         #   ^ beyond sensing region pos=2, steps=3
         #    ^ one step to beginning of sensing region pos=3
         #     ^ add floor(steps/2)=1, result pos=4
+        # record first and last sensing steps, the terminal step is just beyond the sensing region
+        self.region = (self.steps - steps, self.steps - 1) if forward else (self.steps + 1, self.steps + steps)
+
         half = 1 + int((steps - 1) / 2) # subtract terminal step off of sensing region
-        self.take_steps(not forward, half)
+        # stepping back re-enters the sensing region from the other side, note where for verification
+        back_entry = None
+        for i in range(half):
+            self._onestep(not forward)
+            if back_entry is None and self.sensor.sensing():
+                back_entry = self.steps
         all_steps.append(-half)
+        self.entries = {forward: entry}
+        if back_entry is not None:
+            self.entries[not forward] = back_entry
+        self._last_sensing = None
         return True, all_steps
@@ -4,6 +4,25 @@ import motor
 import stub
 
 
+class LaggingMotorAssembly(stub.MotorAssembly):
+    """
+    Stub motor assembly with a sensor that lags 3 degrees behind the direction of travel,
+    so the sensing region is entered at different steps from either side.
+    """
+
+    def __init__(self, start_degrees, sensor_ranges):
+        super().__init__(start_degrees, sensor_ranges)
+        self.forward = True
+
+    def onestep(self, direction):
+        self.forward = direction == motor.FORWARD
+        super().onestep(direction)
+
+    def sensing(self):
+        lag = 3 if self.forward else -3
+        return any(lo + lag <= self.degrees <= hi + lag for lo, hi in self.sensor_ranges)
+
+
 class TestMotor(unittest.TestCase):
     def test_scan(self):
         ma = stub.MotorAssembly(0, [(60, 79)])
@@ -52,3 +71,71 @@ class TestMotor(unittest.TestCase):
         ma = stub.MotorAssembly(100, [(0, 50)])
         m = motor.Motor(ma, ma, max_steps=25)
         self.assertRaises(ValueError, m.scan, True, 50, 50)
+
+    def test_scan_region(self):
+        ma = stub.MotorAssembly(0, [(60, 79)])
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        self.assertEqual((60, 79), m.region)
+        m.scan(False, 100, 50)  # scan from within region, back off at 59 and return
+        self.assertEqual((60, 79), m.region)
+
+    def test_verify_forward_lost_steps(self):
+        ma = stub.MotorAssembly(0, [(60, 79)])
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        m.enable_verification(360)
+        ma.degrees -= 3  # lose 3 steps
+        m.take_steps(True, 360)
+        self.assertEqual([3], m.pop_offsets())
+        self.assertEqual([], m.pop_offsets())
+        self.assertEqual(70, ma.degrees)  # back in agreement with motor steps
+        self.assertEqual(70 + 360, m.steps)
+
+    def test_verify_backward_lost_steps(self):
+        ma = stub.MotorAssembly(0, [(60, 79)])
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        m.enable_verification(360)
+        ma.degrees += 2  # lose 2 steps backward
+        for i in range(180):  # single steps as in clock mode
+            m.take_steps(False, 2)
+        self.assertEqual([2], m.pop_offsets())
+        self.assertEqual(70, ma.degrees)
+
+    def test_verify_within_tolerance(self):
+        ma = stub.MotorAssembly(0, [(60, 79)])
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        m.enable_verification(360, tolerance=1)
+        ma.degrees += 1  # gain 1 step
+        m.take_steps(True, 360)
+        self.assertEqual([], m.pop_offsets())
+        self.assertEqual(71, ma.degrees)
+
+    def test_verify_hysteresis(self):
+        ma = LaggingMotorAssembly(0, [(60, 79)])  # sensing 63..82 moving forward, 57..76 moving backward
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        self.assertEqual({True: 63, False: 76}, m.entries)
+        m.enable_verification(360)
+        reference = ma.degrees
+        for i in range(360):  # single steps as in clock mode, moon orbit turns backward
+            m.take_steps(False, 1)
+        self.assertEqual([], m.pop_offsets())
+        self.assertEqual(reference, ma.degrees)
+        m.take_steps(True, 360)
+        self.assertEqual([], m.pop_offsets())
+        self.assertEqual(reference, ma.degrees)
+
+    def test_verify_hysteresis_lost_steps(self):
+        ma = LaggingMotorAssembly(0, [(60, 79)])
+        m = motor.Motor(ma, ma)
+        m.scan(True, 100, 50)
+        m.enable_verification(360)
+        reference = ma.degrees
+        ma.degrees += 2  # lose 2 steps backward
+        for i in range(360):
+            m.take_steps(False, 1)
+        self.assertEqual([2], m.pop_offsets())
+        self.assertEqual(reference, ma.degrees)
@@ -0,0 +1,263 @@
+import argparse
+import atexit
+import logging
+import math
+import queue
+import threading
+import time
+from datetime import datetime
+
+import numpy
+
+import earth
+import model
+import motor
+import scheduler
+
+logger = logging.getLogger(__name__)
+
+STEPS_PER_REV = 200
+
+EO_SLEEP = 0.1
+ER_SLEEP = 0.05
+MO_SLEEP = 0.05
+
+TICK = 1.0  # longest wall-clock seconds between successive poses
+MAX_DEGREES_PER_TICK = 90  # default tick keeps every axis well under the half revolution that aliases
+BATCH_SIZE = 60  # poses computed per batch
+BATCHES_AHEAD = 2  # batches buffered ahead of the motors
+SAMPLE_DAYS = 1  # maximum spacing of poses sampled to estimate axis rates
+
+# mean rates used to unwrap sampled changes, actual changes stay within a few degrees of these
+EO_DEGREES_PER_DAY = 360 / 365.2422  # tropical year
+ER_DEGREES_PER_DAY = 360  # solar day
+MO_DEGREES_PER_DAY = 360 / 29.530589  # synodic month
+
+
+class AxisRate:
+    """
+    Class composed of a motor axis name, the peak number of steps the axis must take in one tick,
+    the motor sleep between steps, and whether the motion per tick aliases.
+    A rotation of half a revolution or more per tick aliases because the model takes the shortest path.
+    """
+
+    def __init__(self, name, steps, sleep, aliased=False):
+        self.name = name
+        self.steps = steps
+        self.sleep = sleep
+        self.aliased = aliased
+
+    def seconds(self):
+        """
+        Wall-clock seconds the axis spends stepping in the busiest tick.
+        """
+        return self.steps * self.sleep
+
+    def feasible(self, tick):
+        return not self.aliased and self.seconds() <= tick
+
+    def __repr__(self):
+        return f'{self.name}[steps={self.steps}, seconds={self.seconds():.2f}, aliased={self.aliased}]'
+
+
+def default_tick(rate):
+    """
+    Computes the wall-clock seconds between poses for the input rate in days per second.
+    Earth rotation, with earth orbit compensation, is the fastest axis and turns at most MAX_DEGREES_PER_TICK per tick.
+    """
+    if rate <= 0:
+        raise ValueError(f'rate must be positive, rate={rate}')
+    return min(TICK, MAX_DEGREES_PER_TICK / (rate * (ER_DEGREES_PER_DAY + EO_DEGREES_PER_DAY)))
+
+
+def track_times(start, end, rate, tick=TICK):
+    """
+    Computes the Skyfield Time array of poses between start and end.
+    Rate is the number of days of model time that pass per wall-clock second.
+    """
+    if rate <= 0:
+        raise ValueError(f'rate must be positive, rate={rate}')
+    if tick <= 0:
+        raise ValueError(f'tick must be positive, tick={tick}')
+    if end.tt < start.tt:
+        raise ValueError('end must not precede start')
+    days_per_tick = rate * tick
+    count = int(math.floor((end.tt - start.tt) / days_per_tick + 1e-6)) + 1  # tolerate float error at end
+    return earth.timescale.tt_jd(start.tt + numpy.arange(count) * days_per_tick)
+
+
+def batches(times, batch_size=BATCH_SIZE):
+    """
+    Generates lists of Earth objects for consecutive slices of the input Time array.
+    """
+    for i in range(0, len(times.tt), batch_size):
+        yield earth.earth_track(times[i:i + batch_size])
+
+
+def _unwrap(degrees, expected):
+    """
+    Resolves a change in degrees, known only modulo 360, to the value nearest the expected change.
+    """
+    return expected + (degrees - expected + 180) % 360 - 180
+
+
+def axis_rates(em, times):
+    """
+    Computes the peak steps per tick required on each axis over the whole span of the input Time array.
+    Poses are sampled at most SAMPLE_DAYS apart and their changes are unwrapped using elapsed model time,
+    so rotations of half a revolution or more per tick are counted in full rather than by the shortest path.
+    The earth orbit unwind at summer solstice is taken from the pair of ticks that straddle it.
+    Returns list of AxisRate objects in earth orbit, earth rotation, moon orbit order.
+    """
+    if len(times.tt) < 2:
+        return [AxisRate('earth_orbit', 0, em.eo_motor.sleep),
+                AxisRate('earth_rotation', 0, em.er_motor.sleep),
+                AxisRate('moon_orbit', 0, em.mo_motor.sleep)]
+
+    first, last = times.tt[0], times.tt[-1]
+    days_per_tick = times.tt[1] - first
+    tts = numpy.append(numpy.arange(first, last, max(days_per_tick, SAMPLE_DAYS)), last)
+    samples = earth.earth_track(earth.timescale.tt_jd(tts))
+
+    peaks = [0, 0, 0]
+    for t0, t1, e0, e1 in zip(tts, tts[1:], samples, samples[1:]):
+        elapsed = t1 - t0
+        eo = _unwrap(e1.eo_degrees - e0.eo_degrees, elapsed * EO_DEGREES_PER_DAY)
+        er = _unwrap(e1.er_degrees - e0.er_degrees, elapsed * ER_DEGREES_PER_DAY)
+        mo = _unwrap(e1.mo_degrees - e0.mo_degrees, elapsed * MO_DEGREES_PER_DAY)
+
+        # earth orbit motor turns backward through the first half of the orbit, see Model._rescale_earth_orbit
+        eo_motor = -eo if (e0.eo_degrees + eo / 2) % 360 < 180 else eo
+        er_motor = er - eo_motor
+        mo_motor = -mo + eo_motor  # moon is inverted
+
+        scale = days_per_tick / elapsed
+        peaks = [max(peak, abs(degrees) * scale) for peak, degrees in zip(peaks, (eo_motor, er_motor, mo_motor))]
+
+    steps = [math.ceil(peak / em.units.degrees_per_step() - 1e-9) for peak in peaks]
+    aliased = [s >= em.units.steps_per_half_rev() for s in steps]
+
+    for et in earth.season_event_times(times[0], times[-1]):
+        if et.event.value == earth.EVENT_SUMMER_SOLSTICE:
+            i = min(int((et.time.tt - first) / days_per_tick), len(times.tt) - 2)
+            poses = earth.earth_track(times[i:i + 2])
+            eo_diff = em.diffs(em.targets(poses[0]), em.targets(poses[1]))[0]
+            steps[0] = max(steps[0], eo_diff.get()[1])
+
+    return [
+        AxisRate('earth_orbit', steps[0], em.eo_motor.sleep, aliased[0]),
+        AxisRate('earth_rotation', steps[1], em.er_motor.sleep, aliased[1]),
+        AxisRate('moon_orbit', steps[2], em.mo_motor.sleep, aliased[2])]
+
+
+def keeps_up(em, rates, tick=TICK):
+    """
+    Determines if all axes of the model can complete the busiest tick in time.
+    With a motion scheduler the move time comes from its plan, so axes moving in parallel overlap;
+    without one, axes move one after another and their stepping time adds up.
+    """
+    if not all(r.feasible(tick) for r in rates):
+        return False
+    motors = [em.eo_motor, em.er_motor, em.mo_motor]
+    moves = [scheduler.Move(r.name, m, True, r.steps) for r, m in zip(rates, motors)]
+    if em.scheduler:
+        seconds = em.scheduler.plan(moves, motors).seconds
+    else:
+        seconds = sum(move.seconds() for move in moves)
+    return seconds <= tick
+
+
+def turn_off_motors(steppers):
+    for stepper in steppers:
+        stepper.release()
+
+
+def _produce(track_batches, q):
+    """
+    Puts batches on the queue, followed by any error raised computing them, and always a terminating None.
+    """
+    try:
+        for batch in track_batches:
+            q.put(batch)
+    except Exception as e:
+        q.put(e)
+    finally:
+        q.put(None)
+
+
+def play(em, times, log, tick=TICK, batch_size=BATCH_SIZE):
+    """
+    Moves the model through the poses of the input Time array, one pose per tick.
+    Per-axis rates over the whole span are reported before any motion.
+    An axis whose rotation per tick aliases is reported as infeasible, so keeps_up is reported False.
+    The first batch is computed up front, remaining batches on a background thread ahead of the motors.
+    Returns list of AxisRate objects.
+    """
+    rates = axis_rates(em, times)
+    for r in rates:
+        log.info(f'axis rate, motor={r.name}, steps={r.steps}, seconds={r.seconds():.2f}, '
+                 f'tick={tick}, aliased={r.aliased}, feasible={r.feasible(tick)}')
+    log.info(f'playback, poses={len(times.tt)}, keeps_up={keeps_up(em, rates, tick)}')
+
+    track_batches = batches(times, batch_size)
+    first = next(track_batches)
+
+    q = queue.Queue(maxsize=BATCHES_AHEAD)
+    producer = threading.Thread(target=_produce, args=(track_batches, q), daemon=True)
+    producer.start()
+
+    em.next(first[0])  # move to start pose before the clock starts
+    start = time.monotonic()
+    i = 0
+    batch = first[1:]
+    while batch is not None:
+        for e in batch:
+            i += 1
+            delay = start + i * tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            em.next(e)
+        batch = q.get()
+        if isinstance(batch, Exception):
+            raise batch
+
+    lag = time.monotonic() - start - i * tick
+    log.info(f'playback complete, poses={i + 1}, lag={max(lag, 0):.2f}')
+    return rates
+
+
+def main():
+    from adafruit_motorkit import MotorKit
+
+    import sensor
+
+    parser = argparse.ArgumentParser(description='Play earth and moon motion between two dates.')
+    parser.add_argument('start', help='ISO-formatted start date-time')
+    parser.add_argument('end', help='ISO-formatted end date-time')
+    parser.add_argument('rate', type=float, help='days of model time per second')
+    parser.add_argument('--tick', type=float, help='seconds between poses, derived from rate by default')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] <%(threadName)s> %(levelname)s - %(message)s')
+
+    kit = MotorKit()
+    kit2 = MotorKit(address=0x61)
+
+    ma = scheduler.MOTOR_MA
+    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(17), EO_SLEEP, STEPS_PER_REV, stepping_ma=ma, holding_ma=ma)
+    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(27), ER_SLEEP, stepping_ma=ma, holding_ma=ma)
+    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(23), MO_SLEEP, stepping_ma=ma, holding_ma=ma)
+
+    atexit.register(turn_off_motors, [kit.stepper1, kit.stepper2, kit2.stepper1])
+
+    em = model.Model(eo_motor, er_motor, mo_motor, logger, STEPS_PER_REV, scheduler.Scheduler())
+    em.init()
+
+    start = earth.timescale.from_datetime(datetime.fromisoformat(args.start))
+    end = earth.timescale.from_datetime(datetime.fromisoformat(args.end))
+    tick = args.tick if args.tick is not None else default_tick(args.rate)
+    play(em, track_times(start, end, args.rate, tick), logger, tick)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+import unittest
+from unittest import mock
+
+import earth
+import model
+import motor
+import playback
+import scheduler
+import stub
+
+
+class TestLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+def new_model(sleep=0, steps_per_rev=360, motion_scheduler=None):
+    sensor_range = [(350, 360), (0, 10)]
+    eo_tm = stub.MotorAssembly(100, sensor_range)
+    er_tm = stub.MotorAssembly(200, sensor_range)
+    mo_tm = stub.MotorAssembly(300, sensor_range)
+    eo_motor = motor.Motor(eo_tm, eo_tm, sleep)
+    er_motor = motor.Motor(er_tm, er_tm, sleep)
+    mo_motor = motor.Motor(mo_tm, mo_tm, sleep)
+    return model.Model(eo_motor, er_motor, mo_motor, TestLogger(), steps_per_rev, motion_scheduler)
+
+
+class TestPlayback(unittest.TestCase):
+    def test_track_times(self):
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 6, 2)
+        times = playback.track_times(start, end, 0.25, 0.5)  # 1/8 day per tick
+        self.assertEqual(9, len(times.tt))
+        self.assertAlmostEqual(end.tt, times[-1].tt)
+
+    def test_track_times_inexact_interval(self):
+        start = earth.timescale.utc(2022, 6, 21)
+        end = earth.timescale.utc(2022, 6, 21, 2)
+        times = playback.track_times(start, end, 10 / 1440, 1)  # 10 minutes per tick is inexact in binary
+        self.assertEqual(13, len(times.tt))
+
+    def test_track_times_invalid(self):
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 6, 2)
+        self.assertRaises(ValueError, playback.track_times, end, start, 1)
+        self.assertRaises(ValueError, playback.track_times, start, end, 0)
+        self.assertRaises(ValueError, playback.track_times, start, end, -1)
+        self.assertRaises(ValueError, playback.track_times, start, end, 1, 0)
+        self.assertEqual(1, len(playback.track_times(start, start, 1).tt))
+
+    def test_axis_rates(self):
+        em = new_model(0.01, 200)
+        start = earth.timescale.utc(2023, 1, 1)
+        end = earth.timescale.utc(2023, 1, 8)
+        rates = playback.axis_rates(em, playback.track_times(start, end, 0.1, 1))
+        self.assertEqual(1, rates[0].steps)
+        self.assertAlmostEqual(20, rates[1].steps, delta=1)  # 36 degrees of rotation plus orbit compensation
+        self.assertEqual(1, rates[2].steps)
+        self.assertFalse(any(r.aliased for r in rates))
+        self.assertTrue(playback.keeps_up(em, rates, 1))
+        self.assertFalse(rates[1].feasible(0.15))
+        tick = rates[1].seconds()
+        self.assertFalse(playback.keeps_up(em, rates, tick))  # serial moves need 0.01 + tick + 0.01
+
+        em.scheduler = scheduler.Scheduler()
+        self.assertTrue(playback.keeps_up(em, rates, tick))  # parallel moves need max(0.01, tick, 0.01)
+
+    def test_axis_rates_aliased(self):
+        # a day per tick turns the earth a full revolution, which the shortest path would reduce to nothing
+        em = new_model(0.01, 200)
+        start = earth.timescale.utc(2023, 1, 1)
+        end = earth.timescale.utc(2023, 2, 1)
+        times = playback.track_times(start, end, 1, 1)
+        rates = playback.axis_rates(em, times)
+        self.assertAlmostEqual(200, rates[1].steps, delta=2)
+        self.assertTrue(rates[1].aliased)
+        self.assertFalse(rates[1].feasible(10))
+        self.assertFalse(playback.keeps_up(em, rates, 10))
+
+        em = new_model(0, 200)
+        em.init()
+        log = TestLogger()
+        playback.play(em, times, log, 0.001)  # reported, not refused
+        self.assertIn(f'playback, poses={len(times.tt)}, keeps_up=False', log.messages)
+
+    def test_default_tick(self):
+        self.assertEqual(playback.TICK, playback.default_tick(0.1))
+        tick = playback.default_tick(1)
+        self.assertLess(tick, playback.TICK)
+        em = new_model(0.01, 200)
+        start = earth.timescale.utc(2023, 1, 1)
+        end = earth.timescale.utc(2023, 2, 1)
+        rates = playback.axis_rates(em, playback.track_times(start, end, 1, tick))
+        self.assertAlmostEqual(50, rates[1].steps, delta=1)  # quarter revolution per tick
+        self.assertFalse(any(r.aliased for r in rates))
+        self.assertRaises(ValueError, playback.default_tick, 0)
+
+    def test_axis_rates_summer_solstice(self):
+        # earth orbit unwinds a full revolution at summer solstice, months after the first batch
+        em = new_model(0.1, 200)
+        start = earth.timescale.utc(2022, 11, 1)
+        end = earth.timescale.utc(2023, 10, 1)
+        rates = playback.axis_rates(em, playback.track_times(start, end, 0.3, 1))
+        self.assertGreater(rates[0].steps, 190)
+        self.assertFalse(rates[0].aliased)
+        self.assertFalse(rates[0].feasible(1))
+
+    def test_play(self):
+        em = new_model()
+        em.init()
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 6, 3)
+        times = playback.track_times(start, end, 25, 0.01)  # 1/4 day per tick
+        playback.play(em, times, TestLogger(), 0.01, batch_size=3)
+
+        expected = new_model()
+        expected.init()
+        expected.next(earth.earth(end))
+        self.assertEqual(expected.eo_motor.steps % 360, em.eo_motor.steps % 360)
+        self.assertEqual(expected.er_motor.steps % 360, em.er_motor.steps % 360)
+        self.assertEqual(expected.mo_motor.steps % 360, em.mo_motor.steps % 360)
+
+    def test_play_batch_error(self):
+        em = new_model()
+        em.init()
+        start = earth.timescale.utc(2022, 6, 1)
+        end = earth.timescale.utc(2022, 6, 3)
+        times = playback.track_times(start, end, 25, 0.01)
+        track = earth.earth_track
+        calls = []
+
+        def failing_track(t):
+            calls.append(t)
+            if len(calls) > 1:
+                raise ValueError('outside ephemeris')
+            return track(t)
+
+        with mock.patch.object(earth, 'earth_track', failing_track):
+            self.assertRaises(ValueError, playback.play, em, times, TestLogger(), 0.01, batch_size=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
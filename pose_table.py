@@ -0,0 +1,128 @@
+import argparse
+import math
+import mmap
+import os
+import struct
+from datetime import datetime
+
+import numpy
+
+import earth
+
+# file layout, all little-endian:
+# header: magic (8 bytes), start TT julian date (float64), interval in days (float64), record count (uint32)
+# records: earth orbit, earth rotation, and moon orbit degrees (3 x float32) per interval
+MAGIC = b'EMMPOSE1'
+HEADER = struct.Struct('<8sddI')
+RECORD = struct.Struct('<3f')
+
+MINUTE = 1 / 1440
+BATCH_SIZE = 1440  # records computed per batch, one day of minutes
+
+
+class PoseTable:
+    """
+    Memory-mapped table of earth and moon positions at a fixed interval.
+    Lookups are O(1) index arithmetic; times outside the table yield None.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size or self.mm[:len(MAGIC)] != MAGIC:
+            self.mm.close()
+            raise ValueError(f'not a pose table, path={path}')
+        magic, self.start, self.interval, self.count = HEADER.unpack_from(self.mm, 0)
+        size = HEADER.size + self.count * RECORD.size
+        if len(self.mm) != size:
+            self.mm.close()
+            raise ValueError(f'pose table size mismatch, path={path}, expected={size}, actual={len(self.mm)}')
+
+    def close(self):
+        self.mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def index(self, time):
+        """
+        Locates the record nearest the input time.
+        Returns record index or None if time is outside the table.
+        """
+        i = int(round((time.tt - self.start) / self.interval))
+        return i if 0 <= i < self.count else None
+
+    def earth(self, time):
+        """
+        Returns Earth object for the record nearest the input time or None if time is outside the table.
+        """
+        i = self.index(time)
+        if i is None:
+            return None
+        return earth.Earth(*RECORD.unpack_from(self.mm, HEADER.size + i * RECORD.size))
+
+    def targets(self, time, em):
+        """
+        Returns list of target Steps objects of the input model for the record nearest the input time
+        or None if time is outside the table.
+        """
+        e = self.earth(time)
+        return em.targets(e) if e else None
+
+
+def earth_at(table, time):
+    """
+    Looks up earth and moon positions in the pose table, computing them with Skyfield outside its range.
+    """
+    e = table.earth(time) if table else None
+    return e if e else earth.earth(time)
+
+
+def generate(path, start, end, interval=MINUTE, batch_size=BATCH_SIZE):
+    """
+    Writes a pose table covering start to end Skyfield times at the input interval in days.
+    The table is written to a temporary file that replaces path once complete, so an interrupted run
+    never leaves a partial table behind.
+    Returns number of records written.
+    """
+    count = int(math.floor((end.tt - start.tt) / interval + 1e-6)) + 1  # tolerate float error at end
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, start.tt, interval, count))
+            for i in range(0, count, batch_size):
+                n = min(batch_size, count - i)
+                times = earth.timescale.tt_jd(start.tt + (i + numpy.arange(n)) * interval)
+                track = earth.earth_track(times)
+                rows = [(e.eo_degrees, e.er_degrees, e.mo_degrees) for e in track]
+                f.write(numpy.array(rows, dtype='<f4').tobytes())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a table of earth and moon positions.')
+    parser.add_argument('start', help='ISO-formatted first date-time')
+    parser.add_argument('end', help='ISO-formatted last date-time')
+    parser.add_argument('output', help='output table path')
+    parser.add_argument('--minutes', type=float, default=1, help='minutes between records')
+    args = parser.parse_args()
+
+    start = earth.timescale.from_datetime(datetime.fromisoformat(args.start))
+    end = earth.timescale.from_datetime(datetime.fromisoformat(args.end))
+    count = generate(args.output, start, end, args.minutes * MINUTE)
+    print(f'{count} records written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+
+import earth
+import model
+import motor
+import pose_table
+import stub
+
+
+class TestPoseTable(unittest.TestCase):
+
+    def test_generate_and_lookup(self):
+        start = earth.timescale.utc(2022, 6, 21)
+        end = earth.timescale.utc(2022, 6, 21, 2)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'poses.bin')
+            count = pose_table.generate(path, start, end, 10 * pose_table.MINUTE, batch_size=5)
+            self.assertEqual(13, count)
+            self.assertEqual(pose_table.HEADER.size + 13 * pose_table.RECORD.size, os.path.getsize(path))
+
+            with pose_table.PoseTable(path) as table:
+                self.assertEqual(13, len(table))
+                t = earth.timescale.utc(2022, 6, 21, 1, 22)  # nearest record is 1:20
+                self.assertEqual(8, table.index(t))
+                expected = earth.earth(earth.timescale.utc(2022, 6, 21, 1, 20))
+                e = table.earth(t)
+                self.assertAlmostEqual(expected.eo_degrees, e.eo_degrees, places=3)
+                self.assertAlmostEqual(expected.er_degrees, e.er_degrees, places=3)
+                self.assertAlmostEqual(expected.mo_degrees, e.mo_degrees, places=3)
+
+                ma = stub.MotorAssembly(0, [])
+                m = motor.Motor(ma, ma)
+                em = model.Model(m, m, m, None, 360)
+                self.assertEqual(em.targets(e), table.targets(t, em))
+
+                self.assertIsNone(table.earth(earth.timescale.utc(2022, 6, 20, 23)))
+                self.assertIsNone(table.earth(earth.timescale.utc(2022, 6, 21, 3)))
+
+    def test_truncated(self):
+        start = earth.timescale.utc(2022, 6, 21)
+        end = earth.timescale.utc(2022, 6, 21, 2)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'poses.bin')
+            pose_table.generate(path, start, end, 10 * pose_table.MINUTE)
+            self.assertEqual(['poses.bin'], os.listdir(d))  # temporary file replaced the table
+            with open(path, 'r+b') as f:
+                f.truncate(pose_table.HEADER.size + 5 * pose_table.RECORD.size)
+            self.assertRaises(ValueError, pose_table.PoseTable, path)
+
+    def test_earth_at(self):
+        start = earth.timescale.utc(2022, 6, 21)
+        end = earth.timescale.utc(2022, 6, 21, 2)
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, 'poses.bin')
+            pose_table.generate(path, start, end, 10 * pose_table.MINUTE)
+
+            with pose_table.PoseTable(path) as table:
+                t = earth.timescale.utc(2022, 6, 21, 1, 22)  # nearest record is 1:20
+                e = pose_table.earth_at(table, t)
+                self.assertEqual(table.earth(t).er_degrees, e.er_degrees)
+
+                t = earth.timescale.utc(2022, 6, 21, 3)  # outside the table
+                expected = earth.earth(t)
+                e = pose_table.earth_at(table, t)
+                self.assertAlmostEqual(expected.eo_degrees, e.eo_degrees)
+                self.assertAlmostEqual(expected.er_degrees, e.er_degrees)
+                self.assertAlmostEqual(expected.mo_degrees, e.mo_degrees)
+
+            e = pose_table.earth_at(None, t)
+            self.assertAlmostEqual(expected.er_degrees, e.er_degrees)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# current draw measured with a multimeter, see Current Draw section of README
+RPI_MA = 113  # Raspberry Pi Zero W alone
+MOTOR_MA = 140  # each NEMA-17 motor with coils energized, stepping or holding
+SUPPLY_MA = 2000  # 5V 2A power supply
+
+
+class Move:
+    """
+    Class composed of an axis name, a Motor object, a direction, and a number of steps.
+    """
+
+    def __init__(self, name, motor, forward, steps):
+        self.name = name
+        self.motor = motor
+        self.forward = forward
+        self.steps = steps
+
+    def seconds(self):
+        return self.steps * self.motor.sleep
+
+    def run(self):
+        self.motor.take_steps(self.forward, self.steps)
+
+
+class Plan:
+    """
+    Class composed of (1) groups of moves, where groups run one after another and moves within a group
+    run in parallel, (2) motors to release before each group, (3) peak estimated supply current,
+    and (4) estimated move time.
+    """
+
+    def __init__(self, groups, releases, peak_ma, seconds):
+        self.groups = groups
+        self.releases = releases
+        self.peak_ma = peak_ma
+        self.seconds = seconds
+
+    def __repr__(self):
+        groups = ' '.join('+'.join(m.name for m in group) for group in self.groups)
+        return f'groups=[{groups}], peak_ma={self.peak_ma}, seconds={self.seconds:.2f}'
+
+
+class Scheduler:
+    """
+    Schedules motor moves so that estimated supply current stays within budget.
+    Moves are packed longest first into groups that run in parallel.
+    With release, idle motors are de-energized between groups and after the last group,
+    so they draw no holding current.
+    """
+
+    def __init__(self, budget_ma=SUPPLY_MA, base_ma=RPI_MA, release=True):
+        self.budget_ma = budget_ma
+        self.base_ma = base_ma
+        self.release = release
+
+    def _current(self, group, energized):
+        """
+        Estimates supply current while the group steps and the other energized motors hold.
+        """
+        moving = [m.motor for m in group]
+        holding = [motor for motor in energized if motor not in moving]
+        return self.base_ma + sum(motor.stepping_ma for motor in moving) + sum(motor.holding_ma for motor in holding)
+
+    def plan(self, moves, motors):
+        """
+        Plans the input moves given all motors sharing the supply.
+        Returns Plan object.
+        """
+        groups = []
+        for move in sorted((m for m in moves if m.steps), key=Move.seconds, reverse=True):
+            for group in groups:
+                if self._fits(group + [move], motors):
+                    group.append(move)
+                    break
+            else:
+                groups.append([move])
+
+        releases = []
+        peak_ma = self.base_ma
+        energized = [motor for motor in motors if motor.energized]
+        for group in groups:
+            moving = [m.motor for m in group]
+            released = [motor for motor in energized if self.release and motor not in moving]
+            energized = [motor for motor in energized if motor not in released]
+            releases.append(released)
+            current = self._current(group, energized)
+            if current > self.budget_ma:
+                raise ValueError(f'move exceeds current budget, moves={[m.name for m in group]}, ma={current}')
+            peak_ma = max(peak_ma, current)
+            energized += [motor for motor in moving if motor not in energized]
+        releases.append(energized if self.release else [])
+
+        seconds = sum(max(m.seconds() for m in group) for group in groups)
+        return Plan(groups, releases, peak_ma, seconds)
+
+    def _fits(self, group, motors):
+        """
+        Determines if a group fits within budget when every other motor holds, the worst case before release.
+        """
+        energized = [] if self.release else motors
+        return self._current(group, energized) <= self.budget_ma
+
+    def run(self, plan):
+        """
+        Runs groups of moves one after another, moves within a group in parallel.
+        """
+        for released, group in zip(plan.releases, plan.groups):
+            for motor in released:
+                motor.release()
+            if len(group) == 1:
+                group[0].run()
+            else:
+                with ThreadPoolExecutor(max_workers=len(group)) as executor:
+                    list(executor.map(Move.run, group))
+        for motor in plan.releases[-1]:
+            motor.release()
@@ -0,0 +1,106 @@
+import unittest
+from collections import namedtuple
+
+import model
+import motor
+import scheduler
+import stub
+
+Earth = namedtuple('Earth', ['eo_degrees', 'er_degrees', 'mo_degrees'])
+
+
+class TestLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+class ReleaseCounter(stub.MotorAssembly):
+    def __init__(self, start_degrees, sensor_ranges):
+        super().__init__(start_degrees, sensor_ranges)
+        self.releases = 0
+
+    def release(self):
+        self.releases += 1
+
+
+def new_motor(sleep, start_degrees=0):
+    ma = ReleaseCounter(start_degrees, [])
+    return motor.Motor(ma, ma, sleep, stepping_ma=140, holding_ma=100)
+
+
+class TestScheduler(unittest.TestCase):
+    def test_all_axes_within_budget(self):
+        motors = [new_motor(0.1), new_motor(0.05), new_motor(0.05)]
+        moves = [scheduler.Move('a', motors[0], True, 100),
+                 scheduler.Move('b', motors[1], True, 100),
+                 scheduler.Move('c', motors[2], False, 40)]
+        plan = scheduler.Scheduler(2000, 113).plan(moves, motors)
+        self.assertEqual([['a', 'b', 'c']], [[m.name for m in g] for g in plan.groups])
+        self.assertEqual(113 + 3 * 140, plan.peak_ma)
+        self.assertAlmostEqual(10, plan.seconds)
+
+    def test_tight_budget(self):
+        motors = [new_motor(0.1), new_motor(0.05), new_motor(0.05)]
+        moves = [scheduler.Move('a', motors[0], True, 10),
+                 scheduler.Move('b', motors[1], True, 100),
+                 scheduler.Move('c', motors[2], True, 40)]
+        plan = scheduler.Scheduler(113 + 2 * 140, 113).plan(moves, motors)
+        self.assertEqual([['b', 'c'], ['a']], [[m.name for m in g] for g in plan.groups])  # longest first
+        self.assertEqual(113 + 2 * 140, plan.peak_ma)
+        self.assertAlmostEqual(5 + 1, plan.seconds)
+
+    def test_holding_without_release(self):
+        motors = [new_motor(0.1), new_motor(0.05), new_motor(0.05)]
+        for m in motors:
+            m.take_steps(True, 1)  # energize coils
+        moves = [scheduler.Move('a', motors[0], True, 10),
+                 scheduler.Move('b', motors[1], True, 10),
+                 scheduler.Move('c', motors[2], True, 0)]
+        plan = scheduler.Scheduler(113 + 140 + 2 * 100, 113, release=False).plan(moves, motors)
+        self.assertEqual([['a'], ['b']], [[m.name for m in g] for g in plan.groups])
+        self.assertEqual(113 + 140 + 2 * 100, plan.peak_ma)
+
+    def test_release_idle(self):
+        motors = [new_motor(0), new_motor(0), new_motor(0)]
+        for m in motors:
+            m.take_steps(True, 1)  # energize coils
+        moves = [scheduler.Move('a', motors[0], True, 10),
+                 scheduler.Move('b', motors[1], True, 0),
+                 scheduler.Move('c', motors[2], True, 0)]
+        s = scheduler.Scheduler()
+        plan = s.plan(moves, motors)
+        self.assertEqual(scheduler.RPI_MA + 140, plan.peak_ma)
+        s.run(plan)
+        self.assertEqual([1, 1, 1], [m.stepper.releases for m in motors])  # idle before, moved after
+        self.assertEqual([False, False, False], [m.energized for m in motors])
+        self.assertEqual(11, motors[0].stepper.degrees)
+
+    def test_over_budget(self):
+        motors = [new_motor(0)]
+        moves = [scheduler.Move('a', motors[0], True, 10)]
+        self.assertRaises(ValueError, scheduler.Scheduler(200, 113).plan, moves, motors)
+
+    def test_model(self):
+        sensor_range = [(350, 360), (0, 10)]
+        eo_tm = stub.MotorAssembly(100, sensor_range)
+        er_tm = stub.MotorAssembly(200, sensor_range)
+        mo_tm = stub.MotorAssembly(300, sensor_range)
+        eo_motor = motor.Motor(eo_tm, eo_tm, stepping_ma=140, holding_ma=140)
+        er_motor = motor.Motor(er_tm, er_tm, stepping_ma=140, holding_ma=140)
+        mo_motor = motor.Motor(mo_tm, mo_tm, stepping_ma=140, holding_ma=140)
+        logger = TestLogger()
+        em = model.Model(eo_motor, er_motor, mo_motor, logger, 360, scheduler.Scheduler())
+        em.init()
+        em.next(Earth(90, 30, 60))
+        self.assertEqual(-100 - 90, eo_motor.steps)
+        self.assertEqual(160 + 90 + 30, er_motor.steps)
+        self.assertEqual(60 - 90 - 60, mo_motor.steps)
+        self.assertIn('motion plan, groups=[earth_orbit+earth_rotation+moon_orbit], peak_ma=533, seconds=0.00',
+                      logger.messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
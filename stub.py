@@ -10,5 +10,8 @@ class MotorAssembly:
         if self.degrees > 360:
             self.degrees -= 360
 
+    def release(self):
+        pass
+
     def sensing(self):
         return any(r[0] <= self.degrees <= r[1] for r in self.sensor_ranges)
@@ -8,6 +8,7 @@ from adafruit_motorkit import MotorKit
 import earth
 import model
 import motor
+import scheduler
 import sensor
 
 logger = logging.getLogger(__name__)
@@ -28,13 +29,14 @@ def main():
     kit = MotorKit()
     kit2 = MotorKit(address=0x61)
 
-    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(17), EO_SLEEP, STEPS_PER_REV)
-    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(27), ER_SLEEP)
-    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(23), MO_SLEEP)
+    ma = scheduler.MOTOR_MA
+    eo_motor = motor.Motor(kit.stepper1, sensor.Sensor(17), EO_SLEEP, STEPS_PER_REV, stepping_ma=ma, holding_ma=ma)
+    er_motor = motor.Motor(kit.stepper2, sensor.Sensor(27), ER_SLEEP, stepping_ma=ma, holding_ma=ma)
+    mo_motor = motor.Motor(kit2.stepper1, sensor.Sensor(23), MO_SLEEP, stepping_ma=ma, holding_ma=ma)
 
     atexit.register(turn_off_motors, [kit.stepper1, kit.stepper2, kit2.stepper1])
 
-    eo_model = model.Model(eo_motor, er_motor, mo_motor, logger, STEPS_PER_REV)
+    eo_model = model.Model(eo_motor, er_motor, mo_motor, logger, STEPS_PER_REV, scheduler.Scheduler())
     eo_model.init()
 
     for line in sys.stdin: